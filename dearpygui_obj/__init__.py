@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from dearpygui import dearpygui as dpgcore
 
 if TYPE_CHECKING:
-    from typing import Dict, Iterable, Optional, Callable, Any, Union
+    from typing import Dict, Iterable, List, Optional, Callable, Any, Union
     from dearpygui_obj.wrapper.widget import Widget
     from dearpygui_obj.window import Window
 
@@ -133,10 +133,44 @@ def _generate_id(o: Any) -> str:
     _IDGEN_SEQ += 1
     return name
 
+## Per-Frame Hooks
+
+# The user's render callback, invoked by _on_render()
+_render_callback: Optional[Callable] = None
+
+# Internal tasks that are polled once per frame by _on_render(), before the user's render callback.
+# Tasks are responsible for removing themselves once they are no longer needed.
+_frame_tasks: List[Callable[[], None]] = []
+
+# Whether _on_render() has been installed as DPG's render callback by set_render_callback()
+_render_hook_installed = False
+
+def _on_render(*args: Any) -> None:
+    if _frame_tasks:
+        for task in list(_frame_tasks):
+            task()
+    if _render_callback is not None:
+        _render_callback(*args)
+
+def _warn_if_frame_tasks_not_run() -> None:
+    # the render callback is never replaced behind the user's back, so features that need
+    # _frame_tasks only work once the user has called set_render_callback()
+    if _frame_tasks and not _render_hook_installed:
+        warn("lazy containers will not be built unless set_render_callback() is used to set the render callback")
+
+def _get_frame_stamp() -> float:
+    """Identifies the current frame, used to expire caches that are only valid for one frame.
+
+    DPG's total time is updated once per frame by DPG itself, so unlike counting calls to
+    _on_render() this still works if the render callback was replaced outside of the wrapper.
+    It is 0 until the GUI starts rendering, and nothing should be cached before then."""
+    return dpgcore.get_total_time()
+
 ## Start/Stop DearPyGui
 
 def start_gui(*, primary_window: Window = None) -> None:
     """Start the GUI engine and show the main window."""
+    _warn_if_frame_tasks_not_run()
     if primary_window is not None:
         dpgcore.start_dearpygui(primary_window=primary_window.id)
     else:
@@ -158,9 +192,15 @@ def set_exit_callback(callback: Callable) -> None:
     """Fires when the main window is exited."""
     dpgcore.set_exit_callback(callback)  # not wrapped because sender will not be a widget anyways
 
-def set_render_callback(callback: Callable) -> None:
-    """Fires after rendering each frame."""
-    dpgcore.set_render_callback(callback)  # not wrapped because sender will not be a widget anyways
+def set_render_callback(callback: Optional[Callable]) -> None:
+    """Fires after rendering each frame.
+
+    This must also be called before starting the GUI if any lazily built containers are used
+    (see :class:`.Menu` and :class:`.TabItem`). Pass ``None`` if no callback is needed."""
+    global _render_callback, _render_hook_installed
+    _render_callback = callback  # not wrapped because sender will not be a widget anyways
+    dpgcore.set_render_callback(_on_render)
+    _render_hook_installed = True
 
 def get_delta_time() -> float:
     """Get the time elapsed since the last frame."""
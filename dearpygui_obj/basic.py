@@ -168,7 +168,7 @@ class RadioButtons(Widget, ItemWidgetMx, ValueWidgetMx[int], MutableSequence[str
         dpgcore.add_radio_button(self.id, **dpg_args)
 
     def _get_items(self) -> List[str]:
-        return self.get_config()['items']
+        return list(self.get_config()['items'])  # copy, since callers modify the list
 
     def __len__(self) -> int:
         return len(self._get_items())
@@ -266,7 +266,7 @@ class Combo(Widget, ItemWidgetMx, ValueWidgetMx[str], MutableSequence[str]):
         dpgcore.add_combo(self.id, **dpg_args)
 
     def _get_items(self) -> List[str]:
-        return self.get_config()['items']
+        return list(self.get_config()['items'])  # copy, since callers modify the list
 
     def __len__(self) -> int:
         return len(self._get_items())
@@ -333,7 +333,7 @@ class ListBox(Widget, ItemWidgetMx, ValueWidgetMx[int], MutableSequence[str]):
         dpgcore.add_listbox(self.id, **dpg_args)
 
     def _get_items(self) -> List[str]:
-        return self.get_config()['items']
+        return list(self.get_config()['items'])  # copy, since callers modify the list
 
     def __len__(self) -> int:
         return len(self._get_items())
@@ -13,6 +13,7 @@ from dearpygui_obj.data import (
     color_from_float as from_float,
     color_from_rgba8 as from_rgba8,
     color_from_hex as from_hex,
+    color_from_argb32 as from_argb32,
 )
 
 ## Red Colors
@@ -96,7 +97,7 @@ dark_turquoise      = from_hex('#00CED1')
 medium_turquoise    = from_hex('#48D1CC')
 turquoise           = from_hex('#40E0D0')
 aqua                = from_hex('#00FFFF')
-cyan                = from_hex('#00FFFF')
+cyan                = aqua
 aquamarine          = from_hex('#7FFFD4')
 pale_turquoise      = from_hex('#AFEEEE')
 light_cyan          = from_hex('#E0FFFF')
@@ -127,7 +128,7 @@ dark_slate_blue     = from_hex('#483D8B')
 blue_violet         = from_hex('#8A2BE2')
 dark_orchid         = from_hex('#9932CC')
 fuchsia             = from_hex('#FF00FF')
-magenta             = from_hex('#FF00FF')
+magenta             = fuchsia
 slate_blue          = from_hex('#6A5ACD')
 medium_slate_blue   = from_hex('#7B68EE')
 medium_orchid       = from_hex('#BA55D3')
@@ -182,6 +183,7 @@ __all__ = [
     'from_float',
     'from_rgba8',
     'from_hex',
+    'from_argb32',
 
     'dark_red',
     'red',
@@ -1,14 +1,51 @@
 from __future__ import annotations
 
 from enum import Enum
+from operator import attrgetter
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from dearpygui import dearpygui as dpgcore
-from dearpygui_obj import _register_item_type
+from dearpygui_obj import _register_item_type, _frame_tasks, _warn_if_frame_tasks_not_run
 from dearpygui_obj.wrapper.widget import Widget, ItemWidgetMx, ContainerWidgetMx, ValueWidgetMx, ConfigProperty
+from dearpygui_obj.wrapper.widget import _add_widget_with
 
 if TYPE_CHECKING:
-    pass
+    from typing import Any, Callable, Dict, Tuple
+    from dearpygui_obj.wrapper.widget import ItemConfigData, ContainerWidget
+
+    ContainerBuilder = Callable[[Any], None]
+
+## Lazy Containers
+
+# containers whose contents have not been built yet, keyed by ID
+_pending_builds: Dict[str, Tuple[ContainerWidget, ContainerBuilder]] = {}
+
+def _build_opened_containers() -> None:
+    for item_id, (container, builder) in list(_pending_builds.items()):
+        if not container.is_valid:
+            del _pending_builds[item_id]
+        elif dpgcore.get_value(item_id):  # menus and tabs have a value of True while open
+            try:
+                builder(container)
+            finally:
+                del _pending_builds[item_id]
+
+    if not _pending_builds:
+        _frame_tasks.remove(_build_opened_containers)
+
+def _set_lazy_builder(container: ContainerWidget, builder: ContainerBuilder) -> None:
+    # the contents are added later using the builder, so the container should not stay on the parent stack
+    if not container.finalized:
+        container.__exit__(None, None, None)
+
+    # a builder may itself create lazy containers, so check the task list rather than _pending_builds
+    if _build_opened_containers not in _frame_tasks:
+        _frame_tasks.append(_build_opened_containers)
+    _pending_builds[container.id] = (container, builder)
+    if dpgcore.is_dearpygui_running():
+        _warn_if_frame_tasks_not_run()  # otherwise start_gui() will check
+
 
 ## Tree Nodes
 
@@ -16,6 +53,8 @@ if TYPE_CHECKING:
 class TreeNode(Widget, ItemWidgetMx, ContainerWidgetMx['TreeNode'], ValueWidgetMx[bool]):
     """A collapsing container with a label."""
 
+    __slots__ = ()
+
     value: bool  #: ``True`` if the header is uncollapsed, otherwise ``False``.
 
     label: str = ConfigProperty()
@@ -33,12 +72,11 @@ class TreeNode(Widget, ItemWidgetMx, ContainerWidgetMx['TreeNode'], ValueWidgetM
     #: and the arrow/bullet not shown (use as a convenience for leaf nodes).
     is_leaf: bool = ConfigProperty(key='leaf')
 
-    def __init__(self, label: str = None, **config):
-        config.setdefault('show', True)  # workaround for DPG 0.6
-        super().__init__(label=label, **config)
+    # show defaults to True as a workaround for DPG 0.6
+    def __init__(self, label: str = None, show: bool = True, **config):
+        super().__init__(label=label, show=show, **config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_tree_node(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_tree_node)
 
 
 
@@ -46,8 +84,9 @@ class TreeNode(Widget, ItemWidgetMx, ContainerWidgetMx['TreeNode'], ValueWidgetM
 class TreeNodeHeader(TreeNode, ContainerWidgetMx['TreeNodeHeader']):
     """Similar to :class:`.TreeNode`, but the label is visually emphasized."""
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_collapsing_header(self.id, **dpg_args)
+    __slots__ = ()
+
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_collapsing_header)
 
 ## Tab Container
 
@@ -59,13 +98,14 @@ class TabBar(Widget, ItemWidgetMx, ContainerWidgetMx['TabBar']):
         This container should only contain :class:`.TabItem` or :class:`.TabButton` elements.
     """
 
+    __slots__ = ()
+
     reorderable: bool = ConfigProperty()
 
     def __init__(self, **config):
         super().__init__(**config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_tab_bar(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_tab_bar)
 
 
 class TabOrderMode(Enum):
@@ -75,13 +115,37 @@ class TabOrderMode(Enum):
     Leading     = 'leading'     #: Enforce the tab position to the left of the tab bar (after the tab list popup button)
     Trailing    = 'trailing'    #: Enforce the tab position to the right of the tab bar (before the scrolling buttons)
 
-@_register_item_type('mvAppItemType::TabItem')
-class TabItem(Widget, ItemWidgetMx, ContainerWidgetMx['TabItem']):
-    """A container whose contents will be displayed when selected in a :class:`.TabBar`.
-
-    Note:
-        This widget must be placed inside a :class:`.TabBar` to be visible.
-    """
+# the config key used by DPG to enable each order mode
+_ORDER_MODE_KEY = {
+    mode : mode.value for mode in TabOrderMode if mode.value is not None
+}
+
+# config data for each order mode, built once since the setter would otherwise rebuild it on every write
+_ORDER_MODE_CONFIGS = {
+    mode : MappingProxyType({
+        key : (other is mode) for other, key in _ORDER_MODE_KEY.items()
+    })
+    for mode in TabOrderMode
+}
+
+# indexed by the bits (leading, trailing, no_reorder) read from config data,
+# with leading taking precedence over trailing and trailing over no_reorder
+_ORDER_MODE_LOOKUP = tuple(
+    TabOrderMode.Leading if bits & 0b100 else
+    TabOrderMode.Trailing if bits & 0b010 else
+    TabOrderMode.Fixed if bits & 0b001 else
+    TabOrderMode.Reorderable
+    for bits in range(8)
+)
+
+def _get_order_mode(config: ItemConfigData) -> TabOrderMode:
+    bits = bool(config.get('leading')) << 2 | bool(config.get('trailing')) << 1 | bool(config.get('no_reorder'))
+    return _ORDER_MODE_LOOKUP[bits]
+
+class _TabConfigMx:
+    """Config properties shared by :class:`.TabItem` and :class:`.TabButton`."""
+
+    __slots__ = ()
 
     label: str = ConfigProperty()
 
@@ -91,70 +155,59 @@ class TabItem(Widget, ItemWidgetMx, ContainerWidgetMx['TabItem']):
     order_mode: TabOrderMode
     @ConfigProperty()
     def order_mode(self) -> TabOrderMode:
-        config = self.get_config()
-        if config.get('leading'):
-            return TabOrderMode.Leading
-        if config.get('trailing'):
-            return TabOrderMode.Trailing
-        if config.get('no_reorder'):
-            return TabOrderMode.Fixed
-        return TabOrderMode.Reorderable
+        return _get_order_mode(self.get_config())
 
     @order_mode.getconfig
     def order_mode(self, value: TabOrderMode):
-        return {
-            mode.value : (mode == value)  for mode in TabOrderMode if mode.value is not None
-        }
+        return _ORDER_MODE_CONFIGS[value]
 
     #: Disable tooltip
     no_tooltip: bool = ConfigProperty()
 
-    def __init__(self, label: str = None, **config):
+
+@_register_item_type('mvAppItemType::TabItem')
+class TabItem(Widget, ItemWidgetMx, _TabConfigMx, ContainerWidgetMx['TabItem']):
+    """A container whose contents will be displayed when selected in a :class:`.TabBar`.
+
+    Note:
+        This widget must be placed inside a :class:`.TabBar` to be visible.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, label: str = None, *, builder: Callable[[TabItem], Any] = None, **config):
+        """
+        Parameters:
+            builder: if provided, the contents of the tab are not created until the tab is first
+                selected. The builder is then called with the tab item and should add its contents
+                using :meth:`.ItemWidgetMx.add_to`. A tab with a builder is finalized immediately
+                and must not be used as a context manager.
+
+                Lazy building runs in the render callback installed by :func:`.set_render_callback`,
+                so that must be called (with ``None`` if no callback is needed) before the GUI starts.
+                A render callback set directly using DearPyGui will stop lazy building.
+        """
         super().__init__(label=label, **config)
+        if builder is not None:
+            _set_lazy_builder(self, builder)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_tab(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_tab)
 
 
 @_register_item_type('mvAppItemType::TabButton')
-class TabButton(Widget, ItemWidgetMx):
+class TabButton(Widget, ItemWidgetMx, _TabConfigMx):
     """A button that can be added to a :class:`TabBar`.
 
     Note:
         This widget must be placed inside a :class:`.TabBar` to be visible.
     """
 
-    label: str = ConfigProperty()
-
-    #: Create a button on the tab that can hide the tab.
-    closable: bool = ConfigProperty()
-
-    order_mode: TabOrderMode
-    @ConfigProperty()
-    def order_mode(self) -> TabOrderMode:
-        config = self.get_config()
-        if config.get('leading'):
-            return TabOrderMode.Leading
-        if config.get('trailing'):
-            return TabOrderMode.Trailing
-        if config.get('no_reorder'):
-            return TabOrderMode.Fixed
-        return TabOrderMode.Reorderable
-
-    @order_mode.getconfig
-    def order_mode(self, value: TabOrderMode):
-        return {
-            mode.value : (mode == value)  for mode in TabOrderMode if mode.value is not None
-        }
-
-    #: Disable tooltip
-    no_tooltip: bool = ConfigProperty()
+    __slots__ = ()
 
     def __init__(self, label: str = None, **config):
         super().__init__(label=label, **config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_tab_button(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_tab_button)
 
 
 ## Menus and Menu Items
@@ -167,19 +220,35 @@ class Menu(Widget, ItemWidgetMx, ContainerWidgetMx['Menu']):
     that can be added anywhere and contain other kinds of widgets (e.g. buttons and text),
     even if it is unusual."""
 
+    __slots__ = ()
+
     label: str = ConfigProperty()
 
-    def __init__(self, label: str = None, **config):
+    def __init__(self, label: str = None, *, builder: Callable[[Menu], Any] = None, **config):
+        """
+        Parameters:
+            builder: if provided, the contents of the menu are not created until the menu is first
+                opened. The builder is then called with the menu and should add its contents
+                using :meth:`.ItemWidgetMx.add_to`. A menu with a builder is finalized immediately
+                and must not be used as a context manager.
+
+                Lazy building runs in the render callback installed by :func:`.set_render_callback`,
+                so that must be called (with ``None`` if no callback is needed) before the GUI starts.
+                A render callback set directly using DearPyGui will stop lazy building.
+        """
         super().__init__(label=label, **config)
+        if builder is not None:
+            _set_lazy_builder(self, builder)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_menu(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_menu)
 
 
 @_register_item_type('mvAppItemType::MenuItem')
 class MenuItem(Widget, ItemWidgetMx):
     """An item for a :class:`.Menu`."""
 
+    __slots__ = ()
+
     label: str = ConfigProperty()
 
     #: Keyboard shortcut, e.g. `'CTRL+M'`.
@@ -193,8 +262,7 @@ class MenuItem(Widget, ItemWidgetMx):
         if value is not None:
             self.value = value
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_menu_item(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_menu_item)
 
 
 ## Popups
@@ -207,15 +275,20 @@ class PopupInteraction(Enum):
     MouseX1     = 3
     MouseX2     = 4
 
+# plain dict lookup avoids the overhead of calling the enum type
+_POPUP_INTERACTION_MAP = { mode.value : mode for mode in PopupInteraction }
+
 @_register_item_type('mvAppItemType::Popup')
 class Popup(Widget, ContainerWidgetMx['Popup']):
     """A container that appears when a :class:`.Widget` is interacted with."""
 
+    __slots__ = ('_popup_parent',)
+
     trigger: PopupInteraction  #: The interaction that will trigger the popup.
     @ConfigProperty(key='mousebutton')
     def trigger(self) -> PopupInteraction:
         config = self.get_config()
-        return PopupInteraction(config['mousebutton'])
+        return _POPUP_INTERACTION_MAP[config['mousebutton']]
 
     @trigger.getconfig
     def trigger(self, trigger: PopupInteraction):
@@ -228,14 +301,14 @@ class Popup(Widget, ContainerWidgetMx['Popup']):
         self._popup_parent = parent
         super().__init__(**config)
 
+    _dpg_add = staticmethod(dpgcore.add_popup)
     def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_popup(self._popup_parent.id, self.id, **dpg_args)
+        self._dpg_add(self._popup_parent.id, self.id, **dpg_args)
 
-    parent: Widget
-    @property
-    def parent(self) -> Widget:
-        """The :class:`.ItemWidgetMx` that the popup is attached to. Cannot be changed."""
-        return self._popup_parent
+    parent: Widget = property(
+        attrgetter('_popup_parent'),
+        doc="""The :class:`.ItemWidgetMx` that the popup is attached to. Cannot be changed.""",
+    )
 
     def close(self) -> None:
         """Closes the popup.
@@ -2,19 +2,26 @@ from __future__ import annotations
 
 import string
 import datetime
-import calendar
+from array import array
+from collections.abc import MutableSequence
 from datetime import date, time
-from typing import TYPE_CHECKING, NamedTuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple, overload
 
 from dearpygui_obj.wrapper.widget import ConfigProperty
 
 if TYPE_CHECKING:
-    from typing import Any, List, Iterable, Union, Mapping
+    from typing import Any, Dict, List, Iterable, Iterator, Tuple, Union, Mapping
     from dearpygui_obj.wrapper.widget import Widget, ItemConfigData
 
 
     number = Union[int, float]
 
+def _clamp(value, min_val, max_val):
+    # a conditional expression avoids the two builtin calls made by min(max(...)), which adds up
+    # in bulk color conversions. "not >=" sends NaN to min_val, the same as min(max(min_val, nan), max_val)
+    return min_val if not value >= min_val else max_val if value > max_val else value
+
 ## Colors
 
 class ColorRGBA(NamedTuple):
@@ -35,10 +42,25 @@ def color_from_float(r: float, g: float, b: float, a: float = 1.0) -> ColorRGBA:
     # noinspection PyArgumentList
     return ColorRGBA(r*255.0, g*255.0, b*255.0, a*255.0)
 
+# constant colors tend to be created over and over, so share a single ColorRGBA for each one
+_INTERNED_COLORS: Dict[Tuple[int, int, int, int], ColorRGBA] = {}
+_MAX_INTERNED_COLORS = 512  # bounded so that procedurally generated colors don't grow it forever
+
 def color_from_rgba8(r: number, g: number, b: number, a: number = 255) -> ColorRGBA:
     """Create a :class:`.ColorRGBA` from 0-255 channel values."""
-    # noinspection PyArgumentList
-    return ColorRGBA(r, g, b, a)
+    # only exact ints are interned, since 255 and 255.0 are equal keys but should give different colors
+    if not (type(r) is int and type(g) is int and type(b) is int and type(a) is int):
+        # noinspection PyArgumentList
+        return ColorRGBA(r, g, b, a)
+
+    key = (r, g, b, a)
+    color = _INTERNED_COLORS.get(key)
+    if color is None:
+        # noinspection PyArgumentList
+        color = ColorRGBA(r, g, b, a)
+        if len(_INTERNED_COLORS) < _MAX_INTERNED_COLORS:
+            _INTERNED_COLORS[key] = color
+    return color
 
 def color_from_hex(color: str) -> ColorRGBA:
     """Create a :class:`.ColorRGBA` from a hex color string.
@@ -50,28 +72,190 @@ def color_from_hex(color: str) -> ColorRGBA:
     """
 
     # strip all non-hex characters from input
-    hexstr = ''.join(c for c in color if c in string.hexdigits)
+    hexstr = color.translate(_STRIP_NONHEX)
+    if not hexstr.isascii():
+        hexstr = ''.join(c for c in hexstr if c in string.hexdigits)
+    return _parse_hex_color(hexstr)
+
+# translation table that deletes all non-hex ASCII characters, other characters are handled separately
+_STRIP_NONHEX = str.maketrans('', '', ''.join(chr(i) for i in range(128) if chr(i) not in string.hexdigits))
+
+# themes tend to use the same few hex colors over and over, and ColorRGBA is immutable so it is safe to share
+@lru_cache(maxsize=256)
+def _parse_hex_color(hexstr: str) -> ColorRGBA:
     hexlen = len(hexstr)
-    if hexlen == 3 or hexlen == 4:
-        values = (c*2 for c in hexstr)  # hex shorthand format
-    elif hexlen == 6 or hexlen == 8:
-        values = (hexstr[i:i+2] for i in range(0, hexlen, 2))
-    else:
-        raise ValueError("unsupported hex color format")
 
-    return color_from_rgba8(*(int(value, 16) for value in values))
+    # parse the whole string at once and unpack the channels using shifts
+    if hexlen == 6:
+        n = int(hexstr, 16)
+        return ColorRGBA(n >> 16, (n >> 8) & 0xFF, n & 0xFF)
+    if hexlen == 8:
+        n = int(hexstr, 16)
+        return ColorRGBA(n >> 24, (n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF)
+
+    # hex shorthand format, each digit is doubled (0xF -> 0xFF)
+    if hexlen == 3:
+        n = int(hexstr, 16)
+        return ColorRGBA((n >> 8) * 0x11, ((n >> 4) & 0xF) * 0x11, (n & 0xF) * 0x11)
+    if hexlen == 4:
+        n = int(hexstr, 16)
+        return ColorRGBA((n >> 12) * 0x11, ((n >> 8) & 0xF) * 0x11, ((n >> 4) & 0xF) * 0x11, (n & 0xF) * 0x11)
+
+    raise ValueError("unsupported hex color format")
+
+def color_from_argb32(argb: int) -> ColorRGBA:
+    """Create a :class:`.ColorRGBA` from a color packed into a single ``0xAARRGGBB`` integer.
+
+    Packed colors take up much less memory than :class:`.ColorRGBA` tuples, which can be useful
+    when storing large tables of colors. See :func:`.color_to_argb32`."""
+    # noinspection PyArgumentList
+    return ColorRGBA((argb >> 16) & 0xFF, (argb >> 8) & 0xFF, argb & 0xFF, (argb >> 24) & 0xFF)
+
+def color_to_argb32(color: Iterable[number]) -> int:
+    """Pack a :class:`ColorRGBA`-like iterable into a single ``0xAARRGGBB`` integer.
+
+    Channel values are clamped to 0-255 and rounded to the nearest integer."""
+    r, g, b, a = (int(_clamp(value, 0, 255) + 0.5) for value in ColorRGBA(*color))
+    return (a << 24) | (r << 16) | (g << 8) | b
 
 def import_color_from_dpg(colorlist: List[number]) -> ColorRGBA:
     """Create a ColorRGBA from DPG color data."""
-    return ColorRGBA(*(min(max(0, value), 255) for value in colorlist))
+    return ColorRGBA(*(_clamp(value, 0, 255) for value in colorlist))
+
+def _import_color_unchecked(colorlist: List[number]) -> ColorRGBA:
+    # for color data that was written by export_color_to_dpg() and is already in range
+    if isinstance(colorlist, ColorRGBA):
+        return colorlist  # written through to a config cache without being converted
+    return ColorRGBA(*colorlist)
 
 def export_color_to_dpg(color: Iterable[number]) -> List[number]:
     """Convert a :class:`ColorRGBA`-like iterable into DPG color data (list of floats 0-255)"""
-    return [min(max(0, value), 255) for value in color]
+    if isinstance(color, ColorRGBA):
+        # always exactly 4 channels, so unroll the clamp instead of running a comprehension
+        r, g, b, a = color
+        return [
+            _clamp(r, 0, 255),
+            _clamp(g, 0, 255),
+            _clamp(b, 0, 255),
+            _clamp(a, 0, 255),
+        ]
+    return [_clamp(value, 0, 255) for value in color]
+
+def import_colors_from_dpg(colorlists: Iterable[List[number]]) -> List[ColorRGBA]:
+    """Create a list of ColorRGBA from a sequence of DPG color data.
+
+    Equivalent to calling :func:`.import_color_from_dpg` on each item."""
+    return list(map(import_color_from_dpg, colorlists))
+
+def export_colors_to_dpg(colors: Iterable[Iterable[number]]) -> List[List[number]]:
+    """Convert a sequence of :class:`ColorRGBA`-like iterables into a list of DPG color data.
+
+    Equivalent to calling :func:`.export_color_to_dpg` on each item."""
+    return list(map(export_color_to_dpg, colors))
+
+class ColorArray(MutableSequence):
+    """A compact sequence of colors.
+
+    Instead of holding a :class:`.ColorRGBA` tuple for each color, the channel values are stored
+    unboxed in a single flat ``array('f')`` (16 bytes per color). Colors are converted to and from
+    :class:`.ColorRGBA` when they are accessed.
+
+    This is useful for storing large numbers of colors, such as palettes or per-vertex colors.
+    Use :func:`.export_colors_to_dpg` to convert the whole array into DPG color data."""
+
+    __slots__ = ('_buf',)
+
+    def __init__(self, colors: Iterable[Iterable[number]] = ()):
+        self._buf = array('f')
+        self.extend(colors)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}({list(self)!r})'
+
+    def __len__(self) -> int:
+        return len(self._buf) // 4
+
+    def _get_offset(self, idx: int) -> int:
+        length = len(self)
+        if idx < 0:
+            idx += length
+        if not 0 <= idx < length:
+            raise IndexError('color index out of range')
+        return idx * 4
+
+    @overload
+    def __getitem__(self, idx: int) -> ColorRGBA: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> ColorArray: ...
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return ColorArray(self[i] for i in range(*idx.indices(len(self))))
+        offset = self._get_offset(idx)
+        return ColorRGBA(*self._buf[offset:offset+4])
+
+    @overload
+    def __setitem__(self, idx: int, color: Iterable[number]) -> None: ...
+
+    @overload
+    def __setitem__(self, idx: slice, color: Iterable[Iterable[number]]) -> None: ...
+
+    def __setitem__(self, idx, color):
+        if isinstance(idx, slice):
+            self._set_slice(idx, ColorArray(color))
+            return
+        offset = self._get_offset(idx)
+        self._buf[offset:offset+4] = array('f', ColorRGBA(*color))
+
+    def _set_slice(self, idx: slice, colors: ColorArray) -> None:
+        start, stop, step = idx.indices(len(self))
+        if step == 1:
+            # like list, a simple slice can be replaced by any number of colors
+            self._buf[start*4:max(start, stop)*4] = colors._buf
+            return
+
+        indices = range(start, stop, step)
+        if len(colors) != len(indices):
+            raise ValueError(f'attempt to assign sequence of size {len(colors)} to extended slice of size {len(indices)}')
+        buf = self._buf
+        for i, color_offset in zip(indices, range(0, len(colors._buf), 4)):
+            buf[i*4:i*4+4] = colors._buf[color_offset:color_offset+4]
+
+    def __delitem__(self, idx: Union[int, slice]) -> None:
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step == 1:
+                del self._buf[start*4:max(start, stop)*4]
+            else:
+                # delete from the end so that the remaining offsets stay valid
+                for i in sorted(range(start, stop, step), reverse=True):
+                    del self._buf[i*4:i*4+4]
+            return
+        offset = self._get_offset(idx)
+        del self._buf[offset:offset+4]
+
+    def __iter__(self) -> Iterator[ColorRGBA]:
+        buf = self._buf
+        for offset in range(0, len(buf), 4):
+            yield ColorRGBA(*buf[offset:offset+4])
+
+    def insert(self, idx: int, color: Iterable[number]) -> None:
+        length = len(self)
+        if idx < 0:
+            idx = max(idx + length, 0)
+        offset = min(idx, length) * 4
+        self._buf[offset:offset] = array('f', ColorRGBA(*color))
+
+    def extend(self, colors: Iterable[Iterable[number]]) -> None:
+        buf = self._buf
+        for color in colors:
+            buf.extend(ColorRGBA(*color))
 
 class ConfigPropertyColorRGBA(ConfigProperty):
+    # the color was clamped by fconfig() when it was written, so it does not need to be clamped again
     def fvalue(self, instance: Widget) -> Any:
-        return import_color_from_dpg(instance.get_config()[self.key])
+        return _import_color_unchecked(instance.get_config()[self.key])
     def fconfig(self, instance: Widget, value: ColorRGBA) -> ItemConfigData:
         return {self.key : export_color_to_dpg(value)}
 
@@ -80,15 +264,17 @@ class ConfigPropertyColorRGBA(ConfigProperty):
 MINYEAR = 1970 #: the smallest year number supported by DPG.
 MAXYEAR = 2999 #: the largest year number supported by DPG.
 
-def _clamp(value, min_val, max_val):
-    return min(max(min_val, value), max_val)
+# number of days in each month of a non-leap year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 def import_date_from_dpg(date_data: Mapping[str, int]) -> date:
     """Convert date data used by DPG into a :class:`~datetime.date` object."""
     year = _clamp(date_data.get('year', MINYEAR), datetime.MINYEAR, datetime.MAXYEAR)
     month = _clamp(date_data.get('month', 1), 1, 12)
 
-    _, max_day = calendar.monthrange(year, month)
+    max_day = _DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        max_day = 29
     day = _clamp(date_data.get('month_day', 1), 1, max_day)
     return date(year, month, day)
 
@@ -131,8 +317,13 @@ __all__ = [
     'color_from_float',
     'color_from_rgba8',
     'color_from_hex',
+    'color_from_argb32',
+    'color_to_argb32',
     'import_color_from_dpg',
     'export_color_to_dpg',
+    'import_colors_from_dpg',
+    'export_colors_to_dpg',
+    'ColorArray',
     'ConfigPropertyColorRGBA',
 
     'MINYEAR',
@@ -6,24 +6,37 @@ from dearpygui_obj import _register_item_type, get_item_by_id
 from dearpygui_obj.window import Window
 
 if TYPE_CHECKING:
-    pass
+    from typing import Any, Callable
 
 
-@_register_item_type('mvAppItemType::DebugWindow')
-class DebugWindow(Window):
+class _DevToolWindow(Window):
+    """Base class for the developer tool windows.
+
+    Subclasses only need to provide the DPG function used to add the window
+    and the ID of the standard instance that DPG creates automatically."""
+
+    _dpg_add: Callable[..., Any]
+    _standard_id: str
 
     def __init__(self, **config):
         super().__init__(**config)
 
-    """Developer tool, creates a window containing handy GUI debugging info."""
     def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_debug_window(self.id, **dpg_args)
-        dpgcore.end()
+        self._dpg_add(self.id, **dpg_args)
+        self._dpg_end()
 
     @classmethod
     def get_instance(cls):
         """Get the standard instance that is automatically created by DPG."""
-        return get_item_by_id('debug##standard')
+        return get_item_by_id(cls._standard_id)
+
+
+@_register_item_type('mvAppItemType::DebugWindow')
+class DebugWindow(_DevToolWindow):
+    """Developer tool, creates a window containing handy GUI debugging info."""
+
+    _dpg_add = staticmethod(dpgcore.add_debug_window)
+    _standard_id = 'debug##standard'
 
     @classmethod
     def show_debug(cls) -> None:
@@ -32,20 +45,11 @@ class DebugWindow(Window):
 
 
 @_register_item_type('mvAppItemType::MetricsWindow')
-class MetricsWindow(Window):
+class MetricsWindow(_DevToolWindow):
     """Developer tool, creates a metrics window."""
 
-    def __init__(self, **config):
-        super().__init__(**config)
-
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_metrics_window(self.id, **dpg_args)
-        dpgcore.end()
-
-    @classmethod
-    def get_instance(cls):
-        """Get the standard instance that is automatically created by DPG."""
-        return get_item_by_id('metrics##standard')
+    _dpg_add = staticmethod(dpgcore.add_metrics_window)
+    _standard_id = 'metrics##standard'
 
     @classmethod
     def show_metrics(cls) -> None:
@@ -53,20 +57,11 @@ class MetricsWindow(Window):
         cls.get_instance().show = True
 
 @_register_item_type('mvAppItemType::StyleWindow')
-class StyleEditorWindow(Window):
+class StyleEditorWindow(_DevToolWindow):
     """Developer tool, creates a window containing a GUI style editor.."""
 
-    def __init__(self, **config):
-        super().__init__(**config)
-
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_style_window(self.id, **dpg_args)
-        dpgcore.end()
-
-    @classmethod
-    def get_instance(cls):
-        """Get the standard instance that is automatically created by DPG."""
-        return get_item_by_id('style##standard')
+    _dpg_add = staticmethod(dpgcore.add_style_window)
+    _standard_id = 'style##standard'
 
     @classmethod
     def show_style_editor(cls) -> None:
@@ -74,20 +69,11 @@ class StyleEditorWindow(Window):
         cls.get_instance().show = True
 
 @_register_item_type('mvAppItemType::DocWindow')
-class DocumentationWindow(Window):
+class DocumentationWindow(_DevToolWindow):
     """Developer tool, creates a window showing DearPyGui documentation."""
 
-    def __init__(self, **config):
-        super().__init__(**config)
-
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_doc_window(self.id, **dpg_args)
-        dpgcore.end()
-
-    @classmethod
-    def get_instance(cls):
-        """Get the standard instance that is automatically created by DPG."""
-        return get_item_by_id('documentation##standard')
+    _dpg_add = staticmethod(dpgcore.add_doc_window)
+    _standard_id = 'documentation##standard'
 
     @classmethod
     def show_documentation(cls) -> None:
@@ -95,20 +81,11 @@ class DocumentationWindow(Window):
         cls.get_instance().show = True
 
 @_register_item_type('mvAppItemType::AboutWindow')
-class AboutWindow(Window):
+class AboutWindow(_DevToolWindow):
     """Developer tool, creates window containing information about DearPyGui."""
 
-    def __init__(self, **config):
-        super().__init__(**config)
-
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_about_window(self.id, **dpg_args)
-        dpgcore.end()
-
-    @classmethod
-    def get_instance(cls):
-        """Get the standard instance that is automatically created by DPG."""
-        return get_item_by_id('about##standard')
+    _dpg_add = staticmethod(dpgcore.add_about_window)
+    _standard_id = 'about##standard'
 
     @classmethod
     def show_about(cls) -> None:
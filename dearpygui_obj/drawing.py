@@ -5,13 +5,12 @@ from typing import TYPE_CHECKING, NamedTuple
 
 from dearpygui import dearpygui as dpgcore
 from dearpygui_obj import _register_item_type
-from dearpygui_obj.data import export_color_to_dpg, import_color_from_dpg
+from dearpygui_obj.data import ColorRGBA, export_color_to_dpg, _import_color_unchecked
 from dearpygui_obj.wrapper.widget import Widget, ItemWidgetMx
 from dearpygui_obj.wrapper.drawing import DrawCommand, DrawProperty
 
 if TYPE_CHECKING:
     from typing import Any, Optional, Tuple, Sequence
-    from dearpygui_obj.data import ColorRGBA
     from dearpygui_obj.window import Window
     from dearpygui_obj.wrapper.drawing import DrawConfigData
 
@@ -117,32 +116,53 @@ class Pos2D(NamedTuple):
 
 
 class DrawPropertyColorRGBA(DrawProperty):
+    # the color was clamped by fconfig() when it was written, so it does not need to be clamped again
     def fvalue(self, instance: Widget) -> Any:
-        return import_color_from_dpg(instance.get_config()[self.key])
+        return _import_color_unchecked(instance.get_config()[self.key])
     def fconfig(self, instance: Widget, value: ColorRGBA) -> DrawConfigData:
+        # ColorRGBA is an immutable tuple which DPG reads directly, so shared palette colors
+        # that are already in range can be passed on as-is instead of packing a new list each time
+        if isinstance(value, ColorRGBA):
+            r, g, b, a = value
+            if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255 and 0 <= a <= 255:
+                return {self.key : value}
         return {self.key : export_color_to_dpg(value)}
 
 class DrawPropertyPos2D(DrawProperty):
     def fvalue(self, instance: DrawCommand) -> Pos2D:
         return Pos2D(*instance.get_config()[self.key])
     def fconfig(self, instance: DrawCommand, value: Tuple[float, float]) -> DrawConfigData:
-        return {self.key : list(value)}
+        # DPG reads tuples as well as lists, so only other sequence types need to be copied
+        if not isinstance(value, (tuple, list)):
+            value = list(value)
+        return {self.key : value}
+
+class DrawPropertyPoints(DrawProperty):
+    # map() keeps the per-point conversion loop in C, which matters for shapes with many points
+    def fvalue(self, instance: DrawCommand) -> Sequence[Pos2D]:
+        return list(map(Pos2D._make, instance.get_config()[self.key]))
+    def fconfig(self, instance: DrawCommand, value: Sequence[Tuple[float, float]]) -> DrawConfigData:
+        return {self.key : list(map(tuple, value))}
 
 
 class DrawLine(DrawCommand):
     """Draws a line."""
 
+    __slots__ = ()
+
     p1: Tuple[float, float] = DrawPropertyPos2D()
     p2: Tuple[float, float] = DrawPropertyPos2D()
     color: ColorRGBA = DrawPropertyColorRGBA()
     thickness: int = DrawProperty()
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_line(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_line(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawRectangle(DrawCommand):
     """Draws a rectangle."""
 
+    __slots__ = ()
+
     pmin: Tuple[float, float] = DrawPropertyPos2D()
     pmax: Tuple[float, float] = DrawPropertyPos2D()
     color: ColorRGBA = DrawPropertyColorRGBA()
@@ -152,11 +172,13 @@ class DrawRectangle(DrawCommand):
     thickness: float = DrawProperty()
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_rectangle(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_rectangle(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawCircle(DrawCommand):
     """Draws a circle."""
 
+    __slots__ = ()
+
     center: Tuple[float, float] = DrawPropertyPos2D()
     radius: float = DrawProperty()
     color: ColorRGBA = DrawPropertyColorRGBA()
@@ -166,11 +188,13 @@ class DrawCircle(DrawCommand):
     fill: ColorRGBA = DrawPropertyColorRGBA()
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_circle(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_circle(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawText(DrawCommand):
     """Draws text."""
 
+    __slots__ = ()
+
     pos: Tuple[float, float] = DrawPropertyPos2D()
     text: str = DrawProperty()
 
@@ -178,11 +202,13 @@ class DrawText(DrawCommand):
     font_size: int = DrawProperty(key='size')
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_text(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_text(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawArrow(DrawCommand):
     """Draw a line with an arrowhead."""
 
+    __slots__ = ()
+
     p1: Tuple[float, float] = DrawPropertyPos2D()
     p2: Tuple[float, float] = DrawPropertyPos2D()
     color: ColorRGBA = DrawPropertyColorRGBA()
@@ -190,18 +216,14 @@ class DrawArrow(DrawCommand):
     arrow_size: int = DrawProperty(key='size')
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_arrow(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_arrow(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawPolyLine(DrawCommand):
     """Draws connected lines."""
 
-    @DrawProperty()
-    def points(self) -> Sequence[Tuple[float, float]]:
-        return [Pos2D(*p) for p in self.get_config()['points']]
+    __slots__ = ()
 
-    @points.getconfig
-    def points(self, value: Sequence[Tuple[float, float]]):
-        return { 'points' : [ list(p) for p in value ] }
+    points: Sequence[Tuple[float, float]] = DrawPropertyPoints()
 
     color: ColorRGBA = DrawPropertyColorRGBA()
 
@@ -209,11 +231,13 @@ class DrawPolyLine(DrawCommand):
     thickness: float = DrawProperty()
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_polyline(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_polyline(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawTriangle(DrawCommand):
     """Draws a triangle."""
 
+    __slots__ = ()
+
     p1: Tuple[float, float] = DrawPropertyPos2D()
     p2: Tuple[float, float] = DrawPropertyPos2D()
     p3: Tuple[float, float] = DrawPropertyPos2D()
@@ -223,11 +247,13 @@ class DrawTriangle(DrawCommand):
     thickness: float = DrawProperty()
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_triangle(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_triangle(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawQuad(DrawCommand):
     """Draws a quadrilateral."""
 
+    __slots__ = ()
+
     p1: Tuple[float, float] = DrawPropertyPos2D()
     p2: Tuple[float, float] = DrawPropertyPos2D()
     p3: Tuple[float, float] = DrawPropertyPos2D()
@@ -238,18 +264,14 @@ class DrawQuad(DrawCommand):
     thickness: float = DrawProperty()
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_quad(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_quad(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawPolygon(DrawCommand):
     """Draws a polygon."""
 
-    @DrawProperty()
-    def points(self) -> Sequence[Tuple[float, float]]:
-        return [Pos2D(*p) for p in self.get_config()['points']]
+    __slots__ = ()
 
-    @points.getconfig
-    def points(self, value: Sequence[Tuple[float, float]]):
-        return { 'points' : [ list(p) for p in value ] }
+    points: Sequence[Tuple[float, float]] = DrawPropertyPoints()
 
     color: ColorRGBA = DrawPropertyColorRGBA()
 
@@ -257,11 +279,13 @@ class DrawPolygon(DrawCommand):
     thickness: float = DrawProperty()
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_polygon(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_polygon(self._canvas_id, tag=self._tag_id, **draw_args)
 
 class DrawBezierCurve(DrawCommand):
     """Draws a bezier curve."""
 
+    __slots__ = ()
+
     p1: Tuple[float, float] = DrawPropertyPos2D()
     p2: Tuple[float, float] = DrawPropertyPos2D()
     p3: Tuple[float, float] = DrawPropertyPos2D()
@@ -272,7 +296,7 @@ class DrawBezierCurve(DrawCommand):
     segments: int = DrawProperty()
 
     def __draw_internal__(self, draw_args) -> None:
-        dpgcore.draw_bezier_curve(self.canvas.id, tag=self.id, **draw_args)
+        dpgcore.draw_bezier_curve(self._canvas_id, tag=self._tag_id, **draw_args)
 
 ## class DrawImage TODO
 
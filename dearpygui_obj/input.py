@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, TypeVar, Generic, Tuple
 from dearpygui import dearpygui as dpgcore
 from dearpygui_obj import _register_item_type
 from dearpygui_obj.wrapper.widget import Widget, ItemWidgetMx, ValueWidgetMx, ConfigProperty
+from dearpygui_obj.wrapper.widget import _add_widget_with
 
 if TYPE_CHECKING:
     from typing import Optional
@@ -37,8 +38,7 @@ class InputText(Widget, ItemWidgetMx, ValueWidgetMx[str]):
     def __init__(self, label: str = None, value: str = '', **config):
         super().__init__(label=label, default_value=value, **config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_text(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_text)
 
 
 ## Kind of went overboard with the type checking here...
@@ -99,64 +99,56 @@ class InputFloat(NumberInput[float, float]):
     """A float input box."""
     _default_value = 0.0
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_float(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_float)
 
 @_register_item_type('mvAppItemType::InputFloat2')
 class InputFloat2(NumberInput[float, Tuple[float, float]]):
     """An input box for 2 floats."""
     _default_value = (0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_float2(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_float2)
 
 @_register_item_type('mvAppItemType::InputFloat3')
 class InputFloat3(NumberInput[float, Tuple[float, float, float]]):
     """An input box for 3 floats."""
     _default_value = (0.0, 0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_float3(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_float3)
 
 @_register_item_type('mvAppItemType::InputFloat4')
 class InputFloat4(NumberInput[float, Tuple[float, float, float, float]]):
     """An input box for 4 floats."""
     _default_value = (0.0, 0.0, 0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_float4(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_float4)
 
 @_register_item_type('mvAppItemType::InputInt')
 class InputInt(NumberInput[int, int]):
     """An integer input box."""
     _default_value = 0
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_int(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_int)
 
 @_register_item_type('mvAppItemType::InputInt2')
 class InputInt2(NumberInput[int, Tuple[int, int]]):
     """An input box for 2 ints."""
     _default_value = (0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_int2(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_int2)
 
 @_register_item_type('mvAppItemType::InputInt3')
 class InputInt3(NumberInput[int, Tuple[int, int, int]]):
     """An input box for 3 ints."""
     _default_value = (0, 0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_int3(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_int3)
 
 @_register_item_type('mvAppItemType::InputInt4')
 class InputInt4(NumberInput[int, Tuple[int, int, int, int]]):
     """An input box for 4 ints."""
     _default_value = (0, 0, 0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_input_int4(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_input_int4)
 
 
 ## Sliders
@@ -192,8 +184,7 @@ class SliderFloat(SliderInput[float, float]):
 
     _default_value = 0.0
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_slider_float(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_slider_float)
 
 @_register_item_type('mvAppItemType::SliderFloat2')
 class SliderFloat2(SliderInput[float, Tuple[float, float]]):
@@ -203,8 +194,7 @@ class SliderFloat2(SliderInput[float, Tuple[float, float]]):
     into an input box for manual input of a value."""
     _default_value = (0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_slider_float2(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_slider_float2)
 
 @_register_item_type('mvAppItemType::SliderFloat3')
 class SliderFloat3(SliderInput[float, Tuple[float, float, float]]):
@@ -214,8 +204,7 @@ class SliderFloat3(SliderInput[float, Tuple[float, float, float]]):
     into an input box for manual input of a value."""
     _default_value = (0.0, 0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_slider_float3(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_slider_float3)
 
 @_register_item_type('mvAppItemType::SliderFloat4')
 class SliderFloat4(SliderInput[float, Tuple[float, float, float, float]]):
@@ -225,8 +214,7 @@ class SliderFloat4(SliderInput[float, Tuple[float, float, float, float]]):
     into an input box for manual input of a value."""
     _default_value = (0.0, 0.0, 0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_slider_float4(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_slider_float4)
 
 @_register_item_type('mvAppItemType::SliderInt')
 class SliderInt(SliderInput[int, int]):
@@ -236,8 +224,7 @@ class SliderInt(SliderInput[int, int]):
     into an input box for manual input of a value."""
     _default_value = 0
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_slider_int(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_slider_int)
 
 @_register_item_type('mvAppItemType::SliderInt2')
 class SliderInt2(SliderInput[int, Tuple[int, int]]):
@@ -247,8 +234,7 @@ class SliderInt2(SliderInput[int, Tuple[int, int]]):
     into an input box for manual input of a value."""
     _default_value = (0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_slider_int2(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_slider_int2)
 
 @_register_item_type('mvAppItemType::SliderInt3')
 class SliderInt3(SliderInput[int, Tuple[int, int, int]]):
@@ -258,8 +244,7 @@ class SliderInt3(SliderInput[int, Tuple[int, int, int]]):
     into an input box for manual input of a value."""
     _default_value = (0, 0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_slider_int3(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_slider_int3)
 
 @_register_item_type('mvAppItemType::SliderInt4')
 class SliderInt4(SliderInput[int, Tuple[int, int, int, int]]):
@@ -269,8 +254,7 @@ class SliderInt4(SliderInput[int, Tuple[int, int, int, int]]):
     into an input box for manual input of a value."""
     _default_value = (0, 0, 0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_slider_int4(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_slider_int4)
 
 
 ## Drag Input Boxes
@@ -305,8 +289,7 @@ class DragFloat(DragInput[float, float]):
 
     _default_value = 0.0
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_drag_float(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_drag_float)
 
 @_register_item_type('mvAppItemType::DragFloat2')
 class DragFloat2(DragInput[float, Tuple[float, float]]):
@@ -316,8 +299,7 @@ class DragFloat2(DragInput[float, Tuple[float, float]]):
     into an input box for manual input of a value."""
     _default_value = (0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_drag_float2(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_drag_float2)
 
 @_register_item_type('mvAppItemType::DragFloat3')
 class DragFloat3(DragInput[float, Tuple[float, float, float]]):
@@ -327,8 +309,7 @@ class DragFloat3(DragInput[float, Tuple[float, float, float]]):
     into an input box for manual input of a value."""
     _default_value = (0.0, 0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_drag_float3(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_drag_float3)
 
 @_register_item_type('mvAppItemType::DragFloat4')
 class DragFloat4(DragInput[float, Tuple[float, float, float, float]]):
@@ -338,8 +319,7 @@ class DragFloat4(DragInput[float, Tuple[float, float, float, float]]):
     into an input box for manual input of a value."""
     _default_value = (0.0, 0.0, 0.0, 0.0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_drag_float4(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_drag_float4)
 
 @_register_item_type('mvAppItemType::DragInt')
 class DragInt(DragInput[int, int]):
@@ -349,8 +329,7 @@ class DragInt(DragInput[int, int]):
     into an input box for manual input of a value."""
     _default_value = 0
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_drag_int(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_drag_int)
 
 @_register_item_type('mvAppItemType::DragInt2')
 class DragInt2(DragInput[int, Tuple[int, int]]):
@@ -360,8 +339,7 @@ class DragInt2(DragInput[int, Tuple[int, int]]):
     into an input box for manual input of a value."""
     _default_value = (0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_drag_int2(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_drag_int2)
 
 @_register_item_type('mvAppItemType::DragInt3')
 class DragInt3(DragInput[int, Tuple[int, int, int]]):
@@ -371,8 +349,7 @@ class DragInt3(DragInput[int, Tuple[int, int, int]]):
     into an input box for manual input of a value."""
     _default_value = (0, 0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_drag_int3(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_drag_int3)
 
 @_register_item_type('mvAppItemType::DragInt4')
 class DragInt4(DragInput[int, Tuple[int, int, int, int]]):
@@ -382,8 +359,7 @@ class DragInt4(DragInput[int, Tuple[int, int, int, int]]):
     into an input box for manual input of a value."""
     _default_value = (0, 0, 0, 0)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_drag_int4(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_drag_int4)
 
 ## Color
 from dearpygui_obj.data import ColorRGBA, ConfigPropertyColorRGBA, import_color_from_dpg, export_color_to_dpg
@@ -404,8 +380,7 @@ class ColorButton(Widget, ItemWidgetMx):
     def __init__(self, color: ColorRGBA = ColorRGBA(1, 0, 1), **config):
         super().__init__(color=export_color_to_dpg(color), **config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_color_button(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_color_button)
 
 class ColorFormatMode(Enum):
     """Specifies how color element values are formatted."""
@@ -457,8 +432,7 @@ class ColorEdit(Widget, ItemWidgetMx, ValueWidgetMx[ColorRGBA]):
     def __init__(self, label: str = None, value: ColorRGBA = ColorRGBA(1, 0, 1), **config):
         super().__init__(label=label, default_value=export_color_to_dpg(value), **config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_color_edit4(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_color_edit4)
 
     def __get_value__(self) -> ColorRGBA:
         return import_color_from_dpg(super().__get_value__())
@@ -513,8 +487,7 @@ class ColorPicker(Widget, ItemWidgetMx, ValueWidgetMx[ColorRGBA]):
     def __init__(self, label: str = None, value: ColorRGBA = ColorRGBA(1, 0, 1), **config):
         super().__init__(label=label, default_value=export_color_to_dpg(value), **config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_color_picker4(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_color_picker4)
 
     def __get_value__(self) -> ColorRGBA:
         return import_color_from_dpg(super().__get_value__())
@@ -556,8 +529,7 @@ class DatePicker(Widget, ItemWidgetMx, ValueWidgetMx[date]):
     def __init__(self, **config):
         super().__init__(**config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_date_picker(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_date_picker)
 
     def __get_value__(self) -> date:
         return import_date_from_dpg(super().__get_value__())
@@ -593,8 +565,7 @@ class TimePicker(Widget, ValueWidgetMx[time]):
     def __init__(self, **config):
         super().__init__(**config)
 
-    def __setup_add_widget__(self, dpg_args) -> None:
-        dpgcore.add_time_picker(self.id, **dpg_args)
+    __setup_add_widget__ = _add_widget_with(dpgcore.add_time_picker)
 
     def __get_value__(self) -> time:
         return import_time_from_dpg(super().__get_value__())
@@ -0,0 +1,125 @@
+"""Recycling of widgets that are frequently removed and re-added."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from dearpygui_obj.wrapper.widget import ContainerWidgetMx
+
+if TYPE_CHECKING:
+    from typing import Any, Optional, Type, Deque, Set
+    from dearpygui_obj.wrapper.widget import ItemWidget, ContainerWidget
+
+_TWidget = TypeVar('_TWidget', bound='ItemWidget')
+
+class WidgetPool(Generic[_TWidget]):
+    """A pool of hidden widgets of a single type that are reused instead of deleted and recreated.
+
+    GUIs that are frequently torn down and rebuilt (for example a tree that is refreshed
+    whenever a filter changes) spend a lot of time adding new items to DPG and deleting them
+    again. Releasing widgets to a pool instead just hides them, so that the next :meth:`acquire`
+    only needs to move, reconfigure and show an existing item.
+
+    For example:
+
+    .. code-block:: python
+
+        node_pool = WidgetPool(TreeNode)
+        nodes = []
+
+        def rebuild(parent, labels):
+            for node in nodes:
+                node_pool.release(node)
+            nodes[:] = [node_pool.acquire(parent, label=label) for label in labels]
+
+    Parameters:
+        widget_type: the :class:`.ItemWidgetMx` type of widget held by the pool.
+        maxsize: the maximum number of hidden widgets to keep. Widgets released to a full
+            pool are deleted. If ``None``, the pool size is not limited.
+    """
+
+    def __init__(self, widget_type: Type[_TWidget], maxsize: Optional[int] = None):
+        self._widget_type = widget_type
+        self._maxsize = maxsize
+        self._free: Deque[_TWidget] = deque()
+        self._pooled: Set[Any] = set()  # IDs of the widgets in _free, so that they can't be released twice
+
+    def __len__(self) -> int:
+        """The number of hidden widgets available for reuse."""
+        return len(self._free)
+
+    @property
+    def widget_type(self) -> Type[_TWidget]:
+        """The type of widget held by the pool."""
+        return self._widget_type
+
+    def acquire(self, parent: ContainerWidget, **config: Any) -> _TWidget:
+        """Get a widget from the pool and add it to the end of the given *parent*.
+
+        If the pool is empty, a new widget is created instead.
+
+        Keyword arguments are used to set config properties on the widget, the same way they
+        would be used when instantiating the widget type.
+
+        Note:
+            A reused widget is not reset. Any config properties that were set while it was previously
+            in use and are not given in the keyword arguments keep their old values.
+
+        Returns:
+            the shown and reconfigured widget.
+        """
+        # check the config first, so that a bad keyword does not lose a widget that was taken from the pool
+        if self._free:
+            config_props = self._widget_type.get_config_properties()
+            for name in config:
+                if name not in config_props:
+                    raise TypeError(f"'{name}' is not a config property of {self._widget_type.__qualname__}")
+
+        while self._free:
+            widget = self._free.pop()
+            self._pooled.discard(widget.id)
+            if widget.is_valid:  # may have been deleted along with its old parent
+                break
+        else:
+            return self._widget_type.add_to(parent, **config)
+
+        widget.set_parent(parent)
+        with widget.batch_config():
+            for name, value in config.items():
+                setattr(widget, name, value)
+            widget.show = True
+        return widget
+
+    def release(self, widget: _TWidget) -> None:
+        """Return a widget to the pool, hiding it.
+
+        If the widget is a container, all of its children are deleted.
+        The widget must not be used after it is released. Releasing a widget that is already
+        in the pool does nothing."""
+        if widget.id in self._pooled:
+            return
+        if self._maxsize is not None and len(self._free) >= self._maxsize:
+            widget.delete()
+            return
+
+        if isinstance(widget, ContainerWidgetMx):
+            for child in list(widget.iter_children()):
+                child.delete()
+
+        widget.show = False
+        self._free.append(widget)
+        self._pooled.add(widget.id)
+
+    def clear(self) -> None:
+        """Delete all of the hidden widgets held by the pool."""
+        while self._free:
+            widget = self._free.pop()
+            if widget.is_valid:
+                widget.delete()
+        self._pooled.clear()
+
+
+__all__ = [
+    'WidgetPool',
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, TypeVar, Sequence, MutableSequence, overload
 
@@ -16,11 +17,11 @@ class DataSeriesConfig:
     """Descriptor used to get/set non-data config properties for :class:`DataSeries` objects."""
 
     def __init__(self, key: str = None):
-        self.key = key
+        self.key = sys.intern(key) if key is not None else None
 
     def __set_name__(self, owner: Type[DataSeries], name: str):
         if self.key is None:
-            self.key = name
+            self.key = sys.intern(name)
 
     def __get__(self, instance: Optional[DataSeries], owner: Type[DataSeries]) -> Any:
         if instance is None:
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
+from itertools import count
 from typing import TYPE_CHECKING
 
 from dearpygui import dearpygui as dpgcore
 
-from dearpygui_obj import _generate_id
+from dearpygui_obj import _get_frame_stamp
+from dearpygui_obj.wrapper.widget import _BatchConfigMx
 
 if TYPE_CHECKING:
-    from typing import Any, Optional, Type, Callable, Mapping
+    from typing import Any, Dict, Optional, Type, Callable, Mapping
     from dearpygui_obj.drawing import DrawingCanvas
 
     DrawConfigData = Mapping[str, Any]
@@ -18,6 +21,9 @@ if TYPE_CHECKING:
 class DrawProperty:
     """Descriptor used to get or set a draw command's configuration."""
 
+    # __dict__ is kept for the custom docstring and any fvalue/fconfig set using the decorators
+    __slots__ = ('owner', 'name', 'key', '_inline_fvalue', '_inline_fconfig', '__dict__')
+
     def __init__(self,
                  key: Optional[str] = None, *,
                  doc: str = ''):
@@ -27,15 +33,20 @@ class DrawProperty:
             doc: custom docstring.
         """
         self.owner = None
-        self.key = key
+        self.key = sys.intern(key) if key is not None else None
         self.__doc__ = doc
 
+        # when the default implementations are used, they are inlined by __get__, __set__
+        # and DrawCommand.__init__ instead of making an extra method call
+        self._inline_fvalue = type(self).fvalue is DrawProperty.fvalue
+        self._inline_fconfig = type(self).fconfig is DrawProperty.fconfig
+
     def __set_name__(self, owner: Type[DrawCommand], name: str):
         self.owner = owner
         self.name = name
 
         if self.key is None:
-            self.key = name
+            self.key = sys.intern(name)
 
         if not self.__doc__:
             self.__doc__ = f"Read or modify the '{self.key}' config field."
@@ -43,11 +54,15 @@ class DrawProperty:
     def __get__(self, instance: Optional[DrawCommand], owner: Type[DrawCommand]) -> Any:
         if instance is None:
             return self
+        if self._inline_fvalue:
+            return instance.get_config()[self.key]
         return self.fvalue(instance)
 
     def __set__(self, instance: DrawCommand, value: Any) -> None:
-        config = self.fconfig(instance, value)
-        dpgcore.modify_draw_command(instance.canvas.id, instance.id, **config)
+        if self._inline_fconfig:
+            instance.set_config(**{self.key : value})
+        else:
+            instance.set_config(**self.fconfig(instance, value))
 
     def __call__(self, fvalue: GetDrawValueFunc):
         """Allows the ConfigProperty itself to be used as a decorator equivalent to :attr:`getvalue`."""
@@ -55,11 +70,13 @@ class DrawProperty:
 
     def getvalue(self, fvalue: GetDrawValueFunc):
         self.fvalue = fvalue
+        self._inline_fvalue = False
         self.__doc__ = fvalue.__doc__ # use the docstring of the getter, the same way property() works
         return self
 
     def getconfig(self, fconfig: GetDrawConfigFunc):
         self.fconfig = fconfig
+        self._inline_fconfig = False
         return self
 
     ## default implementations
@@ -67,44 +84,79 @@ class DrawProperty:
     fconfig: GetDrawConfigFunc
 
     def fvalue(self, instance: DrawCommand) -> Any:
-        return dpgcore.get_draw_command(instance.canvas.id, instance.id)[self.key]
+        return instance.get_config()[self.key]
 
     def fconfig(self, instance: DrawCommand, value: Any) -> DrawConfigData:
         return {self.key : value}
 
 
-class DrawCommand(ABC):
+def _freeze(value: Any) -> Any:
+    # lists are copied before being written through to the config cache, otherwise the caller could
+    # still change what the cache holds. Nested sequences such as points are already copied by their draw property
+    return tuple(value) if isinstance(value, list) else value
+
+# Draw command tags are scoped to their canvas rather than shared with item IDs,
+# so unlike _generate_id() there is no need to ask DPG whether each tag is already in use.
+_next_tag_seq = count().__next__
+
+class DrawCommand(_BatchConfigMx, ABC):
     """Base class for drawing commands."""
 
+    __slots__ = (
+        '_canvas', '_canvas_id', '_tag_id',
+        '_config_cache', '_config_stamp', '_pending_config',
+        '__weakref__',
+    )
+
+    _draw_properties: Mapping[str, DrawProperty] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+
+        # flatten inherited and new draw properties into a single dict when the subclass is created.
+        # positional arguments to __init__() are matched to draw properties in definition order
+        draw_properties = dict(cls._draw_properties)
+        for name, value in cls.__dict__.items():
+            if isinstance(value, DrawProperty):
+                draw_properties[name] = value
+        cls._draw_properties = draw_properties
+
     @classmethod
     def _get_draw_properties(cls) -> Mapping[str, DrawProperty]:
-        draw_properties = cls.__dict__.get('_draw_properties')
-        if draw_properties is None:
-            draw_properties = {}
-            # must match order in annotations
-            for name in cls.__annotations__:
-                value = getattr(cls, name)
-                if isinstance(value, DrawProperty):
-                    draw_properties[name] = value
-            setattr(cls, '_draw_properties', draw_properties)
-        return draw_properties
-
-    _tag_id: str = None
+        return cls._draw_properties
+
+    _tag_id: Optional[str]
+    _config_cache: Optional[DrawConfigData]
+    _config_stamp: Optional[float]
+    _pending_config: Optional[Dict[str, Any]]
+
     def __init__(self, canvas: DrawingCanvas, *args, tag_id: str = None, **kwargs: Any):
+        self._config_cache = None
+        self._config_stamp = None
+        self._pending_config = None
+
         self._canvas = canvas
+        self._canvas_id = canvas.id  # used for every call to DPG, so avoid going through the properties
         if tag_id is not None:
             self._tag_id = tag_id
         else:
-            self._tag_id = _generate_id(self)
+            self._tag_id = f'{self.__class__.__name__}##{_next_tag_seq()}'
 
         props = self._get_draw_properties()
         draw_data = {}
         for prop, value in zip(props.values(), args):
-            draw_data.update(prop.fconfig(self, value))
+            if prop._inline_fconfig:
+                draw_data[prop.key] = value
+            else:
+                draw_data.update(prop.fconfig(self, value))
 
         for name, value in kwargs.items():
             prop = props.get(name)
-            if prop is not None:
+            if prop is None:
+                continue
+            if prop._inline_fconfig:
+                draw_data[prop.key] = value
+            else:
                 draw_data.update(prop.fconfig(self, value))
 
         self.__draw_internal__(draw_data)
@@ -132,23 +184,44 @@ class DrawCommand(ABC):
         return self._canvas
 
     def delete(self) -> None:
-        dpgcore.delete_draw_command(self.canvas.id, self.id)
-        del self._tag_id
+        dpgcore.delete_draw_command(self._canvas_id, self._tag_id)
+        self._tag_id = None
+        self._config_cache = None
 
     def get_config(self) -> DrawConfigData:
-        return dpgcore.get_draw_command(self.canvas.id, self.id)
+        """Get the draw command's configuration data.
+
+        While the GUI is running, the result is cached until the next frame is rendered, and changes
+        made using :meth:`set_config` are written through to the cache. The returned mapping must not be modified."""
+        stamp = _get_frame_stamp()
+        if not stamp:
+            return dpgcore.get_draw_command(self._canvas_id, self._tag_id)  # not rendering yet, so no frame to cache for
+        if self._config_cache is None or self._config_stamp != stamp:
+            self._config_cache = dpgcore.get_draw_command(self._canvas_id, self._tag_id)
+            self._config_stamp = stamp
+        return self._config_cache
 
     def set_config(self, **config: Any) -> None:
-        dpgcore.modify_draw_command(self.canvas.id, self.id, **config)
+        if self._pending_config is not None:
+            self._pending_config.update(config)
+            return
+
+        dpgcore.modify_draw_command(self._canvas_id, self._tag_id, **config)
+
+        # draw commands only change when they are modified through here, so instead of
+        # dropping the cached config, update it with the values that were just written
+        cache = self._config_cache
+        if cache is not None:
+            self._config_cache = {**cache, **{key : _freeze(value) for key, value in config.items()}}
 
     def bring_to_front(self) -> None:
-        dpgcore.bring_draw_command_to_front(self.canvas.id, self.id)
+        dpgcore.bring_draw_command_to_front(self._canvas_id, self._tag_id)
 
     def send_to_back(self) -> None:
-        dpgcore.send_draw_command_to_back(self.canvas.id, self.id)
+        dpgcore.send_draw_command_to_back(self._canvas_id, self._tag_id)
 
     def move_forward(self) -> None:
-        dpgcore.bring_draw_command_forward(self.canvas.id, self.id)
+        dpgcore.bring_draw_command_forward(self._canvas_id, self._tag_id)
 
     def move_back(self) -> None:
-        dpgcore.send_draw_command_back(self.canvas.id, self.id)
\ No newline at end of file
+        dpgcore.send_draw_command_back(self._canvas_id, self._tag_id)
\ No newline at end of file
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from dearpygui import dearpygui as dpgcore
 from dearpygui_obj import (
-    _set_default_ctor, _register_item, _unregister_item,
+    _set_default_ctor, _register_item, _unregister_item, _get_frame_stamp,
     wrap_callback, unwrap_callback,
     get_item_by_id, DataValue,
 )
 
 if TYPE_CHECKING:
-    from typing import Any, Union, Optional, Type, Callable, Iterable, Tuple, Sequence, Mapping, MutableMapping
+    from typing import Any, Dict, Union, Optional, Type, Callable, Iterable, Iterator, Tuple, Sequence, Mapping, MutableMapping
     from dearpygui_obj import PyGuiCallback
 
     ## Type Aliases
@@ -35,6 +37,9 @@ if TYPE_CHECKING:
 class ConfigProperty:
     """Descriptor used to get or set an item's configuration."""
 
+    # __dict__ is kept for the custom docstring and any fvalue/fconfig set using the decorators
+    __slots__ = ('owner', 'name', 'key', 'no_init', '_inline_fvalue', '_inline_fconfig', '__dict__')
+
     def __init__(self,
                  key: Optional[str] = None, *,
                  no_init: bool = False,
@@ -46,16 +51,21 @@ class ConfigProperty:
             doc: custom docstring.
         """
         self.owner = None
-        self.key = key
+        self.key = sys.intern(key) if key is not None else None
         self.no_init = no_init
         self.__doc__ = doc
 
+        # when the default implementations are used, __get__ and __set__ inline them
+        # instead of making an extra method call on every access
+        self._inline_fvalue = type(self).fvalue is ConfigProperty.fvalue
+        self._inline_fconfig = type(self).fconfig is ConfigProperty.fconfig
+
     def __set_name__(self, owner: Type[Widget], name: str):
         self.owner = owner
         self.name = name
 
         if self.key is None:
-            self.key = name
+            self.key = sys.intern(name)
 
         if not self.__doc__:
             self.__doc__ = f"Read or modify the '{self.key}' config property."
@@ -63,11 +73,15 @@ class ConfigProperty:
     def __get__(self, instance: Optional[Widget], owner: Type[Widget]) -> Any:
         if instance is None:
             return self
+        if self._inline_fvalue:
+            return instance.get_config()[self.key]
         return self.fvalue(instance)
 
     def __set__(self, instance: Widget, value: Any) -> None:
-        config = self.fconfig(instance, value)
-        dpgcore.configure_item(instance.id, **config)
+        if self._inline_fconfig:
+            instance.set_config(**{self.key : value})
+        else:
+            instance.set_config(**self.fconfig(instance, value))
 
     def __call__(self, fvalue: GetValueFunc):
         """Allows the ConfigProperty itself to be used as a decorator equivalent to :attr:`getvalue`."""
@@ -75,11 +89,13 @@ class ConfigProperty:
 
     def getvalue(self, fvalue: GetValueFunc):
         self.fvalue = fvalue
+        self._inline_fvalue = False
         self.__doc__ = fvalue.__doc__ # use the docstring of the getter, the same way property() works
         return self
 
     def getconfig(self, fconfig: GetConfigFunc):
         self.fconfig = fconfig
+        self._inline_fconfig = False
         return self
 
     ## default implementations
@@ -87,14 +103,53 @@ class ConfigProperty:
     fconfig: GetConfigFunc
 
     def fvalue(self, instance: Widget) -> Any:
-        return dpgcore.get_item_configuration(instance.id)[self.key]
+        return instance.get_config()[self.key]
 
     def fconfig(self, instance: Widget, value: Any) -> ItemConfigData:
         return {self.key : value}
 
 
 
-class Widget(ABC):
+class _BatchConfigMx:
+    """Provides :meth:`batch_config` for types that implement ``set_config()`` and hold
+    changes in ``_pending_config`` while it is not ``None``."""
+
+    __slots__ = ()
+
+    _pending_config: Optional[Dict[str, Any]]
+    set_config: Callable[..., None]
+
+    @contextmanager
+    def batch_config(self) -> Iterator[None]:
+        """Collect any configuration changes made inside the ``with`` block and apply them
+        using a single call to DPG when the block exits.
+
+        For example:
+
+        .. code-block:: python
+
+            with widget.batch_config():
+                widget.label = 'New Label'
+                widget.width = 200
+                widget.enabled = False
+
+        Note:
+            Reading config properties inside the block will not reflect the pending changes.
+        """
+        if self._pending_config is not None:
+            yield  # already batching, the outermost block will apply the changes
+            return
+
+        self._pending_config = {}
+        try:
+            yield
+        finally:
+            config, self._pending_config = self._pending_config, None
+            if config:
+                self.set_config(**config)
+
+
+class Widget(_BatchConfigMx, ABC):
     """This is the abstract base class for all GUI item wrapper objects.
 
     Keyword arguments passed to ``__init__`` will be used to set the initial values of any
@@ -112,6 +167,9 @@ class Widget(ABC):
         callback: provide a callback that will be set with :meth:`set_callback`.
     """
 
+    # __dict__ is kept so that mixins and subclasses can still add their own attributes
+    __slots__ = ('_widget_id', '_config_cache', '_config_stamp', '_pending_config', '__dict__', '__weakref__')
+
     @classmethod
     def _get_config_properties(cls) -> Mapping[str, ConfigProperty]:
         config_properties = cls.__dict__.get('_config_properties')
@@ -133,6 +191,10 @@ class Widget(ABC):
         return list(cls._get_config_properties().keys())
 
     def __init__(self, *, id: Optional[int] = 0, callback: PyGuiCallback = None, **kwargs: Any):
+        self._config_cache = None
+        self._config_stamp = None
+        self._pending_config = None
+
         id = id or 0
 
         if dpgcore.does_item_exist(id):
@@ -158,7 +220,7 @@ class Widget(ABC):
             for prop, value in config_args.items():
                 config_data.update(prop.fconfig(self, value))
 
-            dpgcore.configure_item(self.id, **config_data)
+            self.set_config(**config_data)
 
             if callback is not None:
                 self.set_callback(callback)
@@ -208,9 +270,25 @@ class Widget(ABC):
     ## Low level config
 
     def get_config(self) -> ItemConfigData:
-        return dpgcore.get_item_configuration(self.id)
+        """Get the item's configuration data.
+
+        While the GUI is running, the result is cached until the next frame is rendered or the
+        configuration is modified using :meth:`set_config`, so that reading several config properties
+        in a row only needs to fetch the configuration from DPG once. The returned mapping must not be modified."""
+        stamp = _get_frame_stamp()
+        if not stamp:
+            return dpgcore.get_item_configuration(self.id)  # not rendering yet, so no frame to cache for
+        if self._config_cache is None or self._config_stamp != stamp:
+            self._config_cache = dpgcore.get_item_configuration(self.id)
+            self._config_stamp = stamp
+        return self._config_cache
 
     def set_config(self, **config: Any) -> None:
+        """Modify the item's configuration data."""
+        if self._pending_config is not None:
+            self._pending_config.update(config)
+            return
+        self._config_cache = None
         dpgcore.configure_item(self.id, **config)
 
     ## Callbacks
@@ -362,6 +440,8 @@ class ContainerWidgetMx(ABC, Generic[_TSelf]):
     Once a container is finalized, additional children can still be added using the
     :meth:`add_child` method."""
 
+    __slots__ = ()
+
     _finalized = False
 
     @property
@@ -378,9 +458,10 @@ class ContainerWidgetMx(ABC, Generic[_TSelf]):
         self._finalized = True
         self.__finalize__()
 
+    _dpg_end = staticmethod(dpgcore.end)
     def __finalize__(self) -> None:
         """Should finalize the container in DPG."""
-        dpgcore.end()
+        self._dpg_end()
 
     @property
     def finalized(self) -> bool:
@@ -418,6 +499,8 @@ class ItemWidgetMx(ABC):
     OOP-style of specifying a widget's parent, you can use the :meth:`add_to` and :meth:`add_before`
     constructor methods."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> str:
@@ -485,6 +568,8 @@ class ValueWidgetMx(ABC, Generic[_TValue]):
     :attr:`data_source` config property.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> str:
@@ -530,6 +615,17 @@ class ValueWidgetMx(ABC, Generic[_TValue]):
         self.data_source.value = v
 
 
+def _add_widget_with(add_func: Callable[..., Any]) -> Callable[[Widget, MutableMapping[str, Any]], None]:
+    """Create a :meth:`.Widget.__setup_add_widget__` implementation for widgets that are added by
+    simply calling a DPG ``add_*()`` function with the widget ID and any left over keywords.
+
+    The DPG function is bound when the class is created rather than being looked up every time
+    a widget is added."""
+    def __setup_add_widget__(self: Widget, dpg_args: MutableMapping[str, Any]) -> None:
+        add_func(self.id, **dpg_args)
+    return __setup_add_widget__
+
+
 class DefaultWidget(Widget, ItemWidgetMx):
     """Fallback type for getting a widget that does not have a wrapper class.
 